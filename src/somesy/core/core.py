@@ -2,10 +2,14 @@
 
 import json
 import logging
+import os
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import tomlkit
+from tomlkit import TOMLDocument
 
 logger = logging.getLogger("somesy")
 
@@ -122,3 +126,76 @@ def get_input_content(path: Path, *, no_unwrap: bool = False) -> Dict[str, Any]:
 
     # no match:
     raise ValueError("Unsupported input file.")
+
+
+def parse_toml(raw: bytes) -> Tuple[TOMLDocument, str]:
+    """Parse the contents of a TOML file, keeping track of its line separator.
+
+    The document is parsed with normalized line endings, because keys added
+    later are always written with LF. Pass the returned separator to
+    `dump_toml` to restore it for the whole file.
+
+    Args:
+        raw: contents of the TOML file
+
+    Returns:
+        the parsed document and the line separator used in the file
+
+    """
+    text = raw.decode("utf-8")
+    if "\r\n" in text:
+        return tomlkit.parse(text.replace("\r\n", "\n")), "\r\n"
+    return tomlkit.parse(text), "\n"
+
+
+def dump_toml(doc: TOMLDocument, newline: str = "\n") -> bytes:
+    """Serialize a TOML document parsed with `parse_toml`, using the given line separator."""
+    text = tomlkit.dumps(doc)
+    if newline != "\n":
+        text = text.replace("\n", newline)
+    return text.encode("utf-8")
+
+
+def write_file_atomic(path: Path, raw: bytes) -> None:
+    """Write a file by swapping in a temporary copy, so it is never half-written.
+
+    Symbolic links are followed, i.e. the file they point to is replaced.
+    Mode, owner and group of an existing file are kept, a new file gets the
+    default permissions (according to the umask). Files with several hard links
+    are written in place instead, replacing them would break the links.
+
+    Args:
+        path: path of the file to write
+        raw: new contents of the file
+
+    """
+    target = path.resolve()
+    try:
+        st: Optional[os.stat_result] = target.stat()
+    except FileNotFoundError:
+        st = None
+    if st is not None and st.st_nlink > 1:
+        target.write_bytes(raw)
+        return
+
+    fd, tmp = tempfile.mkstemp(
+        dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+        if st is None:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp, 0o666 & ~umask)
+        else:
+            shutil.copymode(target, tmp)
+            if hasattr(os, "chown"):
+                try:
+                    os.chown(tmp, st.st_uid, st.st_gid)
+                except PermissionError:
+                    pass  # only possible with sufficient privileges
+        os.replace(tmp, target)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
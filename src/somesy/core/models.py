@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import functools
 import json
-import re
 from datetime import date
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -411,26 +410,25 @@ class Person(SomesyBaseModel):
 
         If the name is `A B C`, then `A B` will be the given names and `C` will be the family name.
         """
-        m = re.match(r"\s*([^<]+)<([^>]+)>", person)
-        if m is None:
-            names = list(map(lambda s: s.strip(), person.split()))
+        # split at the first `<` and the first `>` after it (no regex needed)
+        name, lt, rest = person.partition("<")
+        mail, gt, _ = rest.partition(">")
+        if not (name and lt and mail and gt):  # no e-mail part
+            names = person.split()
             return Person(
                 **{
                     "given-names": " ".join(names[:-1]),
                     "family-names": names[-1],
                 }
             )
-        names, mail = (
-            list(map(lambda s: s.strip(), m.group(1).split())),
-            m.group(2).strip(),
-        )
+        names = name.split()
         # NOTE: for our purposes, does not matter what are given or family names,
         # we only compare on full_name anyway.
         return Person(
             **{
                 "given-names": " ".join(names[:-1]),
                 "family-names": names[-1],
-                "email": mail,
+                "email": mail.strip(),
             }
         )
 
@@ -3,7 +3,7 @@
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from somesy.core.models import Person, ProjectMetadata
 
@@ -120,8 +120,24 @@ class ProjectMetadataWriter(ABC):
 
         """
         key_path = [key] if isinstance(key, str) else key
+        return self._get_nested(
+            self._data, key_path, only_first=only_first, remove=remove
+        )
+
+    @staticmethod
+    def _get_nested(
+        root: DictLike,
+        key_path: List[str],
+        *,
+        only_first: bool = False,
+        remove: bool = False,
+    ) -> Optional[Any]:
+        """Get a value from nested dict-likes, starting from the given root.
 
-        curr = self._data
+        See `_get_property` for the meaning of the arguments.
+        The root object itself is never removed during clean up.
+        """
+        curr = root
         seq = [curr]
         for k in key_path:
             curr = curr.get(k)
@@ -142,6 +158,24 @@ class ProjectMetadataWriter(ABC):
             return curr[0]
         return curr
 
+    @staticmethod
+    def _descend_or_create(
+        root: DictLike, key_path: List[str], new_container: Callable[[], Any] = dict
+    ) -> DictLike:
+        """Return the dict-like at the key path below root, creating missing ones.
+
+        Missing intermediate objects are created using `new_container`
+        (e.g. `tomlkit.table` for TOML-based formats).
+        """
+        curr = root
+        for key in key_path:
+            child = curr.get(key)
+            if child is None:
+                curr[key] = new_container()
+                child = curr[key]  # re-fetch, the value might have been wrapped
+            curr = child
+        return curr
+
     def _set_property(self, key: Union[str, List[str], IgnoreKey], value: Any) -> None:
         """Set a property in the data.
 
@@ -159,12 +193,7 @@ class ProjectMetadataWriter(ABC):
             return
 
         # create path on the fly if needed
-        curr = self._data
-        for key in key_path[:-1]:
-            if key not in curr:
-                curr[key] = {}
-            curr = curr[key]
-
+        curr = self._descend_or_create(self._data, key_path[:-1])
         curr[key_path[-1]] = value
 
     # ----
@@ -1,15 +1,20 @@
 """Pyproject models."""
 
+import os
+import re
 from enum import Enum
 from logging import getLogger
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Union
 
-from packaging.version import parse as parse_version
 from pydantic import (
+    AfterValidator,
     BaseModel,
+    BeforeValidator,
+    Discriminator,
     EmailStr,
     Field,
+    Tag,
     TypeAdapter,
     ValidationError,
     field_validator,
@@ -21,13 +26,81 @@ from somesy.core.models import LicenseEnum
 from somesy.core.types import HttpUrlStr
 
 EMailAddress = TypeAdapter(EmailStr)
+EMailAddresses = TypeAdapter(List[EmailStr])
+HttpUrlAddress = TypeAdapter(HttpUrlStr)
 logger = getLogger("somesy")
 
 
+_FAST_URL_RE = re.compile(
+    r"https?://(?P<host>(?:[A-Za-z0-9-]+\.)*(?P<tld>[A-Za-z0-9-]+)\.?)"
+    r"(?::(?P<port>[0-9]{1,5}))?(?:[/?#]\S*)?"
+)
+"""Canonical http(s) URLs with a plain host name, checked without the full URL parser."""
+
+_MAX_URL_LENGTH = 2083
+"""Maximal URL length accepted by pydantic `HttpUrl`."""
+
+
+def _fast_url(v):
+    """Validate an URL, skipping the full URL parser for canonical http(s) URLs."""
+    if isinstance(v, str) and len(v) <= _MAX_URL_LENGTH and v.isprintable():
+        m = _FAST_URL_RE.fullmatch(v)
+        if (
+            m
+            and m["tld"][0].isalpha()  # otherwise it may be an IPv4 address
+            and (m["port"] is None or 0 < int(m["port"]) <= 65535)
+        ):
+            return v
+    return str(HttpUrlAddress.validate_python(v))
+
+
+_CanonicalHttpUrl = Annotated[str, BeforeValidator(_fast_url)]
+"""URL string type for validation, cheap to check for the common `https://...` case."""
+
+
+_POETRY_AUTHOR_RE = re.compile(r"^(?P<name>.+) <(?P<email>[^<>\s]+)>$")
+"""Poetry person string format `full name <email>`."""
+
+
+def _validate_poetry_person(author):
+    """Return author if it is a `full name <email>` string, otherwise warn and return None."""
+    m = _POETRY_AUTHOR_RE.match(author) if isinstance(author, str) else None
+    try:
+        if m and EMailAddress.validate_python(m["email"]):
+            return author
+    except ValidationError:
+        pass
+    logger.warning(f"Invalid email format for author/maintainer {author}, omitting.")
+    return None
+
+
+def _all_files_exist(paths: List[Path]) -> bool:
+    """Check whether all paths are existing files, listing each directory only once."""
+    by_parent: Dict[Path, Set[str]] = {}
+    for path in paths:
+        by_parent.setdefault(path.parent, set()).add(path.name)
+
+    for parent, names in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                files = {e.name for e in entries if e.is_file()}
+        except OSError:
+            return False
+        # names not listed might still resolve (e.g. case-insensitive file systems)
+        if not all((parent / name).is_file() for name in names - files):
+            return False
+    return True
+
+
+PoetryPersons = TypeAdapter(
+    List[Annotated[str, AfterValidator(_validate_poetry_person)]]
+)
+
+
 class PoetryConfig(BaseModel):
     """Poetry configuration model."""
 
-    model_config = dict(use_enum_values=True)
+    model_config = dict(use_enum_values=True, defer_build=True)
 
     name: Annotated[
         str,
@@ -52,14 +125,14 @@ class PoetryConfig(BaseModel):
     readme: Annotated[
         Optional[Union[Path, List[Path]]], Field(description="Package readme file(s)")
     ] = None
-    homepage: Annotated[Optional[HttpUrlStr], Field(description="Package homepage")] = (
-        None
-    )
+    homepage: Annotated[
+        Optional[_CanonicalHttpUrl], Field(description="Package homepage")
+    ] = None
     repository: Annotated[
-        Optional[HttpUrlStr], Field(description="Package repository")
+        Optional[_CanonicalHttpUrl], Field(description="Package repository")
     ] = None
     documentation: Annotated[
-        Optional[HttpUrlStr], Field(description="Package documentation page")
+        Optional[_CanonicalHttpUrl], Field(description="Package documentation page")
     ] = None
     keywords: Annotated[
         Optional[Set[str]], Field(description="Keywords that describe the package")
@@ -68,50 +141,23 @@ class PoetryConfig(BaseModel):
         Optional[List[str]], Field(description="pypi classifiers")
     ] = None
     urls: Annotated[
-        Optional[Dict[str, HttpUrlStr]], Field(description="Package URLs")
+        Optional[Dict[str, _CanonicalHttpUrl]], Field(description="Package URLs")
     ] = None
 
-    @field_validator("version")
-    @classmethod
-    def validate_version(cls, v):
-        """Validate version using PEP 440."""
-        try:
-            _ = parse_version(v)
-        except ValueError as err:
-            raise ValueError("Invalid version") from err
-        return v
-
     @field_validator("authors", "maintainers")
     @classmethod
     def validate_email_format(cls, v):
         """Validate person format, omit person that is not in correct format, don't raise an error."""
         if v is None:
             return []
-        validated = []
-        for author in v:
-            try:
-                if not (
-                    not isinstance(author, str)
-                    or " " not in author
-                    or not EMailAddress.validate_python(author.split(" ")[-1][1:-1])
-                ):
-                    validated.append(author)
-                else:
-                    logger.warning(
-                        f"Invalid email format for author/maintainer {author}, omitting."
-                    )
-            except ValidationError:
-                logger.warning(
-                    f"Invalid email format for author/maintainer {author}, omitting."
-                )
-        return validated
+        return [a for a in PoetryPersons.validate_python(list(v)) if a is not None]
 
     @field_validator("readme")
     @classmethod
     def validate_readme(cls, v):
         """Validate readme file(s) by checking whether files exist."""
         if isinstance(v, list):
-            if any(not e.is_file() for e in v):
+            if not _all_files_exist(v):
                 logger.warning("Some readme file(s) do not exist")
         else:
             if not v.is_file():
@@ -145,7 +191,7 @@ class License(BaseModel):
     @classmethod
     def validate_xor(cls, values):
         """Validate that only one of file or text is set."""
-        if sum([bool(v) for v in values.values()]) != 1:
+        if bool(values.get("file")) == bool(values.get("text")):
             raise ValueError("Either file or text must be set.")
         return values
 
@@ -160,23 +206,41 @@ class STPerson(BaseModel):
 class URLs(BaseModel):
     """URLs model for setuptools."""
 
-    homepage: Optional[HttpUrlStr] = None
-    repository: Optional[HttpUrlStr] = None
-    documentation: Optional[HttpUrlStr] = None
-    changelog: Optional[HttpUrlStr] = None
+    homepage: Optional[_CanonicalHttpUrl] = None
+    repository: Optional[_CanonicalHttpUrl] = None
+    documentation: Optional[_CanonicalHttpUrl] = None
+    changelog: Optional[_CanonicalHttpUrl] = None
+
+
+def _readme_kind(v) -> str:
+    """Return the tag of the `readme` union member matching the raw value."""
+    if isinstance(v, (dict, File)):
+        return "file"
+    if isinstance(v, list):
+        return "paths"
+    return "path"
 
 
 class SetuptoolsConfig(BaseModel):
     """Setuptools input model. Required fields are name, version, description, and requires_python."""
 
-    model_config = dict(use_enum_values=True)
+    model_config = dict(use_enum_values=True, defer_build=True)
 
     name: Annotated[str, Field(pattern=r"^[A-Za-z0-9]+([_-][A-Za-z0-9]+)*$")]
     version: Annotated[
         str, Field(pattern=r"^\d+(\.\d+)*((a|b|rc)\d+)?(post\d+)?(dev\d+)?$")
     ]
     description: str
-    readme: Optional[Union[Path, List[Path], File]] = None
+    readme: Optional[
+        Annotated[
+            Union[
+                Annotated[Path, Tag("path")],
+                Annotated[List[Path], Tag("paths")],
+                Annotated[File, Tag("file")],
+            ],
+            Discriminator(_readme_kind),
+        ]
+    ] = None
     license: Optional[License] = Field(None, description="An SPDX license identifier.")
     authors: Optional[List[STPerson]] = None
     maintainers: Optional[List[STPerson]] = None
@@ -184,22 +248,12 @@ class SetuptoolsConfig(BaseModel):
     classifiers: Optional[List[str]] = None
     urls: Optional[URLs] = None
 
-    @field_validator("version")
-    @classmethod
-    def validate_version(cls, v):
-        """Validate version using PEP 440."""
-        try:
-            _ = parse_version(v)
-        except ValueError as err:
-            raise ValueError("Invalid version") from err
-        return v
-
     @field_validator("readme")
     @classmethod
     def validate_readme(cls, v):
         """Validate readme file(s) by checking whether files exist."""
         if isinstance(v, list):
-            if any(not e.is_file() for e in v):
+            if not _all_files_exist(v):
                 raise ValueError("Some file(s) do not exist")
         elif type(v) is File:
             if not Path(v.file).is_file():
@@ -212,8 +266,5 @@ class SetuptoolsConfig(BaseModel):
     @classmethod
     def validate_email_format(cls, v):
         """Validate email format."""
-        for person in v:
-            if person.email:
-                if not EMailAddress.validate_python(person.email):
-                    raise ValueError("Invalid email format")
+        EMailAddresses.validate_python([p.email for p in v if p.email])
         return v
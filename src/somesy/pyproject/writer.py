@@ -2,13 +2,14 @@
 
 import logging
 from pathlib import Path
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import tomlkit
-import wrapt
 from rich.pretty import pretty_repr
-from tomlkit import load
+from tomlkit import TOMLDocument
+from tomlkit.items import Array, Trivia
 
+from somesy.core.core import dump_toml, parse_toml, write_file_atomic
 from somesy.core.models import Person, ProjectMetadata
 from somesy.core.writer import IgnoreKey, ProjectMetadataWriter
 
@@ -21,22 +22,44 @@ class PyprojectCommon(ProjectMetadataWriter):
     """Poetry config file handler parsed from pyproject.toml."""
 
     def __init__(
-        self, path: Path, *, section: List[str], model_cls, direct_mappings=None
+        self,
+        path: Path,
+        *,
+        section: List[str],
+        model_cls,
+        direct_mappings=None,
+        data: Optional[TOMLDocument] = None,
+        newline: str = "\n",
     ):
         """Poetry config file handler parsed from pyproject.toml.
 
+        If `data` is passed, it is used as the already parsed contents of `path`,
+        which uses `newline` as line separator.
+
         See [somesy.core.writer.ProjectMetadataWriter.__init__][].
         """
         self._model_cls = model_cls
         self._section = section
+        self._preloaded_data = data
+        self._newline = newline
+        self._key_paths: Dict[str, Tuple[str, ...]] = {}
         super().__init__(
-            path, create_if_not_exists=False, direct_mappings=direct_mappings or {}
+            path,
+            create_if_not_exists=False,
+            direct_mappings=direct_mappings or {},
         )
 
     def _load(self) -> None:
-        """Load pyproject.toml file."""
-        with open(self.path) as f:
-            self._data = tomlkit.load(f)
+        """Load pyproject.toml file (unless it was already parsed)."""
+        if self._preloaded_data is not None:
+            self._data, self._preloaded_data = self._preloaded_data, None
+        else:
+            self._data, self._newline = parse_toml(self.path.read_bytes())
+        # resolve the relevant section once, all properties are accessed relative to it
+        self._section_table = self._get_nested(self._data, self._section)
+        # data was not validated yet, but matches the file
+        self._validated = False
+        self._modified = False
 
     def _validate(self) -> None:
         """Validate poetry config using pydantic class.
@@ -44,57 +67,107 @@ class PyprojectCommon(ProjectMetadataWriter):
         In order to preserve toml comments and structure, tomlkit library is used.
         Pydantic class only used for validation.
         """
-        config = dict(self._get_property([]))
-        logger.debug(
-            f"Validating config using {self._model_cls.__name__}: {pretty_repr(config)}"
-        )
-        self._model_cls(**config)
+        if self._validated:
+            return  # nothing changed since the last successful validation
+
+        config = self._get_property([])  # tomlkit tables are dicts, no copy needed
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Validating config using %s: %s",
+                self._model_cls.__name__,
+                pretty_repr(config),
+            )
+        self._model_cls.model_validate(config)
+        self._validated = True
 
     def save(self, path: Optional[Path] = None) -> None:
         """Save the pyproject file."""
         path = path or self.path
-        with open(path, "w") as f:
-            tomlkit.dump(self._data, f)
+        if not self._modified and path == self.path:
+            return  # nothing was changed since the file was loaded or saved
+
+        raw = dump_toml(self._data, self._newline)
+        if path.is_file() and path.read_bytes() == raw:
+            if path == self.path:
+                self._modified = False
+            return  # file is already up to date, do not touch it
+
+        write_file_atomic(path, raw)
+        if path == self.path:
+            self._modified = False
+
+    def _get_key(self, key: str) -> Union[Tuple[str, ...], IgnoreKey]:
+        """Return the key path of a field inside the section (computed once per field)."""
+        path = self._key_paths.get(key)
+        if path is None:
+            mapped = self.direct_mappings.get(key)
+            if isinstance(mapped, IgnoreKey):
+                return mapped
+            path = tuple(mapped or [key])
+            self._key_paths[key] = path
+        return path
 
     def _get_property(
-        self, key: Union[str, List[str]], *, remove: bool = False, **kwargs
+        self,
+        key_path: Union[str, Sequence[str], IgnoreKey],
+        *,
+        remove: bool = False,
+        **kwargs,
     ) -> Optional[Any]:
-        """Get a property from the pyproject.toml file."""
-        key_path = [key] if isinstance(key, str) else key
-        full_path = self._section + key_path
-        return super()._get_property(full_path, remove=remove, **kwargs)
-
-    def _set_property(self, key: Union[str, List[str], IgnoreKey], value: Any) -> None:
-        """Set a property in the pyproject.toml file."""
-        if isinstance(key, IgnoreKey):
+        """Get a property from the pyproject.toml file.
+
+        The key is a key path (as returned by `_get_key`) or a single top-level key.
+        """
+        if isinstance(key_path, IgnoreKey):
+            return None
+        key_path = (key_path,) if type(key_path) is str else key_path
+        return self._get_nested(self._section_table, key_path, remove=remove, **kwargs)
+
+    def _set_property(
+        self, key_path: Union[str, Sequence[str], IgnoreKey], value: Any
+    ) -> None:
+        """Set a property in the pyproject.toml file.
+
+        The key is a key path (as returned by `_get_key`) or a single top-level key.
+        """
+        if isinstance(key_path, IgnoreKey):
             return
-        key_path = [key] if isinstance(key, str) else key
+        key_path = (key_path,) if type(key_path) is str else key_path
 
         if not value:  # remove value and clean up the sub-dict
-            self._get_property(key_path, remove=True)
+            if self._get_property(key_path, remove=True) is not None:
+                self._validated, self._modified = False, True
             return
 
-        # get the tomlkit object of the section
-        dat = self._get_property([])
-
         # dig down, create missing nested objects on the fly
-        curr = dat
-        for key in key_path[:-1]:
-            if key not in curr:
-                curr.add(key, tomlkit.table())
-            curr = curr[key]
+        curr = self._descend_or_create(
+            self._section_table, key_path[:-1], tomlkit.table
+        )
         curr[key_path[-1]] = value
+        self._validated, self._modified = False, True
 
 
 class Poetry(PyprojectCommon):
     """Poetry config file handler parsed from pyproject.toml."""
 
-    def __init__(self, path: Path):
+    def __init__(
+        self,
+        path: Path,
+        *,
+        data: Optional[TOMLDocument] = None,
+        newline: str = "\n",
+    ):
         """Poetry config file handler parsed from pyproject.toml.
 
-        See [somesy.core.writer.ProjectMetadataWriter.__init__][].
+        See [somesy.pyproject.writer.PyprojectCommon.__init__][].
         """
-        super().__init__(path, section=["tool", "poetry"], model_cls=PoetryConfig)
+        super().__init__(
+            path,
+            section=["tool", "poetry"],
+            model_cls=PoetryConfig,
+            data=data,
+            newline=newline,
+        )
 
     @staticmethod
     def _from_person(person: Person):
@@ -114,10 +187,16 @@ class Poetry(PyprojectCommon):
 class SetupTools(PyprojectCommon):
     """Setuptools config file handler parsed from setup.cfg."""
 
-    def __init__(self, path: Path):
+    def __init__(
+        self,
+        path: Path,
+        *,
+        data: Optional[TOMLDocument] = None,
+        newline: str = "\n",
+    ):
         """Setuptools config file handler parsed from pyproject.toml.
 
-        See [somesy.core.writer.ProjectMetadataWriter.__init__][].
+        See [somesy.pyproject.writer.PyprojectCommon.__init__][].
         """
         section = ["project"]
         mappings = {
@@ -127,13 +206,19 @@ class SetupTools(PyprojectCommon):
             "license": ["license", "text"],
         }
         super().__init__(
-            path, section=section, direct_mappings=mappings, model_cls=SetuptoolsConfig
+            path,
+            section=section,
+            direct_mappings=mappings,
+            model_cls=SetuptoolsConfig,
+            data=data,
+            newline=newline,
         )
 
     @staticmethod
     def _from_person(person: Person):
         """Convert project metadata person object to setuptools dict for person format."""
-        return {"name": person.full_name, "email": person.email}
+        email = person.email
+        return {"name": person.full_name, **({"email": email} if email else {})}
 
     @staticmethod
     def _to_person(person_obj) -> Person:
@@ -141,14 +226,38 @@ class SetupTools(PyprojectCommon):
         # NOTE: for our purposes, does not matter what are given or family names,
         # we only compare on full_name anyway.
         names = list(map(lambda s: s.strip(), person_obj["name"].split()))
+        email = person_obj.get("email")
         return Person(
             **{
                 "given-names": " ".join(names[:-1]),
                 "family-names": names[-1],
-                "email": person_obj["email"].strip(),
+                "email": email.strip() if email else None,
             }
         )
 
+    @staticmethod
+    def _person_array(people: List[Person]) -> Array:
+        """Convert people to a multiline array of inline tables in one pass."""
+        tables = []
+        for person in people:
+            tbl = tomlkit.inline_table()
+            tbl.update(SetupTools._from_person(person))
+            tables.append(tbl)
+        # construct the array at once (appending re-indexes it on every item)
+        return Array(tables, Trivia(), multiline=True)
+
+    @ProjectMetadataWriter.authors.setter
+    def authors(self, authors: List[Person]) -> None:
+        """Set the authors of the project."""
+        self._set_property(self._get_key("authors"), self._person_array(authors))
+
+    @ProjectMetadataWriter.maintainers.setter
+    def maintainers(self, maintainers: List[Person]) -> None:
+        """Set the maintainers of the project."""
+        self._set_property(
+            self._get_key("maintainers"), self._person_array(maintainers)
+        )
+
     def sync(self, metadata: ProjectMetadata) -> None:
         """Sync metadata with pyproject.toml file and fix license field."""
         super().sync(metadata)
@@ -159,15 +268,22 @@ class SetupTools(PyprojectCommon):
             and self._get_property(["license", "text"]) is not None
         ):
             # delete license file property
-            self._data["project"]["license"].pop("file")
+            self._set_property(["license", "file"], None)
 
 
 # ----
 
 
-class Pyproject(wrapt.ObjectProxy):
-    """Class for syncing pyproject file with other metadata files."""
+class Pyproject:
+    """Class for syncing pyproject file with other metadata files.
+
+    All attribute access is delegated to the wrapped setuptools or poetry writer.
+    Unlike with the previous `wrapt.ObjectProxy` based wrapper, `isinstance` checks
+    do not see the wrapped class (e.g. `Poetry` or `ProjectMetadataWriter`),
+    use the `__wrapped__` attribute for them.
+    """
 
+    __slots__ = ("__wrapped__",)
     __wrapped__: Union[SetupTools, Poetry]
 
     def __init__(self, path: Path):
@@ -181,22 +297,32 @@ class Pyproject(wrapt.ObjectProxy):
             ValueError: Neither project nor tool.poetry object is found in pyproject.toml file.
 
         """
-        data = None
-        if not path.is_file():
-            raise FileNotFoundError(f"pyproject file {path} not found")
-
-        with open(path, "r") as f:
-            data = load(f)
+        try:  # read directly instead of checking for the file first
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            raise FileNotFoundError(f"pyproject file {path} not found") from None
+        data, newline = parse_toml(raw)
 
         # inspect file to pick suitable project metadata writer
+        writer: Union[SetupTools, Poetry]
         if "project" in data:
             logger.verbose("Found setuptools-based metadata in pyproject.toml")
-            self.__wrapped__ = SetupTools(path)
+            writer = SetupTools(path, data=data, newline=newline)
         elif "tool" in data and "poetry" in data["tool"]:
             logger.verbose("Found poetry-based metadata in pyproject.toml")
-            self.__wrapped__ = Poetry(path)
+            writer = Poetry(path, data=data, newline=newline)
         else:
             msg = "The pyproject.toml file is ambiguous, either add a [project] or [tool.poetry] section"
             raise ValueError(msg)
 
-        super().__init__(self.__wrapped__)
+        object.__setattr__(self, "__wrapped__", writer)
+
+    def __getattr__(self, name: str) -> Any:
+        """Get attribute from the wrapped writer."""
+        if name == "__wrapped__":  # not initialized, avoid infinite recursion
+            raise AttributeError(name)
+        return getattr(self.__wrapped__, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set attribute on the wrapped writer."""
+        setattr(self.__wrapped__, name, value)
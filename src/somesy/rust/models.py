@@ -10,6 +10,11 @@ from typing_extensions import Annotated
 
 from somesy.core.types import HttpUrlStr
 
+# keyword rules (see check_keyword), combined pattern for the common valid case
+_KEYWORD_RE = re.compile(r"[a-zA-Z0-9][a-zA-Z0-9_\-+]{0,19}")
+_KEYWORD_START_RE = re.compile(r"^[a-zA-Z0-9]")
+_KEYWORD_CHARS_RE = re.compile(r"^[a-zA-Z0-9_\-+]+$")
+
 
 class RustConfig(BaseModel):
     """Rust configuration model."""
@@ -117,6 +122,9 @@ class RustConfig(BaseModel):
 
 def check_keyword(keyword: str):
     """Check if keyword is valid."""
+    if _KEYWORD_RE.fullmatch(keyword):
+        return  # valid, no need to check the rules one by one
+
     # Check if keyword is ASCII and has at most 20 characters
     if not keyword.isascii() or len(keyword) > 20:
         raise ValueError(
@@ -124,9 +132,9 @@ def check_keyword(keyword: str):
         )
 
     # Check if keyword starts with an alphanumeric character
-    if not re.match(r"^[a-zA-Z0-9]", keyword):
+    if not _KEYWORD_START_RE.match(keyword):
         raise ValueError("Each keyword must start with an alphanumeric character")
 
     # Check if keyword contains only allowed characters
-    if not re.match(r"^[a-zA-Z0-9_\-+]+$", keyword):
+    if not _KEYWORD_CHARS_RE.match(keyword):
         raise ValueError("Keywords can only contain letters, numbers, _, -, or +")
@@ -5,8 +5,9 @@ from pathlib import Path
 from typing import Any, List, Optional, Union
 
 from rich.pretty import pretty_repr
-from tomlkit import dump, load, table
+from tomlkit import table
 
+from somesy.core.core import dump_toml, parse_toml, write_file_atomic
 from somesy.core.models import Person, ProjectMetadata
 from somesy.core.writer import FieldKeyMapping, IgnoreKey, ProjectMetadataWriter
 
@@ -27,12 +28,17 @@ class Rust(ProjectMetadataWriter):
         mappings: FieldKeyMapping = {
             "maintainers": IgnoreKey(),
         }
-        super().__init__(path, create_if_not_exists=False, direct_mappings=mappings)
+        super().__init__(
+            path,
+            create_if_not_exists=False,
+            direct_mappings=mappings,
+        )
 
     def _load(self) -> None:
         """Load Cargo.toml file."""
-        with open(self.path) as f:
-            self._data = load(f)
+        self._data, self._newline = parse_toml(self.path.read_bytes())
+        # resolve the relevant section once, all properties are accessed relative to it
+        self._section_table = self._get_nested(self._data, self._section)
 
     def _validate(self) -> None:
         """Validate rust config using pydantic class.
@@ -40,47 +46,58 @@ class Rust(ProjectMetadataWriter):
         In order to preserve toml comments and structure, tomlkit library is used.
         Pydantic class only used for validation.
         """
-        config = dict(self._get_property([]))
-        logger.debug(
-            f"Validating config using {RustConfig.__name__}: {pretty_repr(config)}"
-        )
-        RustConfig(**config)
+        config = self._get_property([])  # tomlkit tables are dicts, no copy needed
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Validating config using %s: %s",
+                RustConfig.__name__,
+                pretty_repr(config),
+            )
+        RustConfig.model_validate(config)
 
     def save(self, path: Optional[Path] = None) -> None:
         """Save the Cargo.toml file."""
         path = path or self.path
-        with open(path, "w") as f:
-            dump(self._data, f)
+        write_file_atomic(path, dump_toml(self._data, self._newline))
+
+    def _get_key(self, key: str) -> Union[List[str], IgnoreKey]:
+        """Return the key path of a field inside the section."""
+        mapped = self.direct_mappings.get(key)
+        return mapped if mapped is not None else [key]
 
     def _get_property(
-        self, key: Union[str, List[str], IgnoreKey], *, remove: bool = False, **kwargs
+        self,
+        key_path: Union[str, List[str], IgnoreKey],
+        *,
+        remove: bool = False,
+        **kwargs,
     ) -> Optional[Any]:
-        """Get a property from the Cargo.toml file."""
-        if isinstance(key, IgnoreKey):
+        """Get a property from the Cargo.toml file.
+
+        The key is a key path (as returned by `_get_key`) or a single top-level key.
+        """
+        if isinstance(key_path, IgnoreKey):
             return None
-        key_path = [key] if isinstance(key, str) else key
-        full_path = self._section + key_path
-        return super()._get_property(full_path, remove=remove, **kwargs)
+        key_path = [key_path] if type(key_path) is str else key_path
+        return self._get_nested(self._section_table, key_path, remove=remove, **kwargs)
+
+    def _set_property(
+        self, key_path: Union[str, List[str], IgnoreKey], value: Any
+    ) -> None:
+        """Set a property in the Cargo.toml file.
 
-    def _set_property(self, key: Union[str, List[str], IgnoreKey], value: Any) -> None:
-        """Set a property in the Cargo.toml file."""
-        if isinstance(key, IgnoreKey):
+        The key is a key path (as returned by `_get_key`) or a single top-level key.
+        """
+        if isinstance(key_path, IgnoreKey):
             return
-        key_path = [key] if isinstance(key, str) else key
+        key_path = [key_path] if type(key_path) is str else key_path
 
         if not value:  # remove value and clean up the sub-dict
             self._get_property(key_path, remove=True)
             return
 
-        # get the tomlkit object of the section
-        dat = self._get_property([])
-
-        # dig down, create missing nested objects on the fly
-        curr = dat
-        for key in key_path[:-1]:
-            if key not in curr:
-                curr.add(key, table())
-            curr = curr[key]
+        # dig down from the section, create missing nested objects on the fly
+        curr = self._descend_or_create(self._section_table, key_path[:-1], table)
         curr[key_path[-1]] = value
 
     @staticmethod
@@ -96,7 +113,7 @@ class Rust(ProjectMetadataWriter):
     @classmethod
     def _parse_people(cls, people: Optional[List[Any]]) -> List[Person]:
         """Return a list of Persons parsed from list of format-specific people representations. to_person can return None, so filter out None values."""
-        return list(filter(None, map(cls._to_person, people or [])))
+        return [p for p in map(cls._to_person, people or []) if p is not None]
 
     @property
     def keywords(self) -> Optional[List[str]]:
@@ -108,15 +125,15 @@ class Rust(ProjectMetadataWriter):
         """Set the keywords of the project."""
         validated_keywords = []
         for keyword in keywords:
+            # keyword count should max 5, so ignore the rest
+            if len(validated_keywords) == 5:
+                break
             try:
                 check_keyword(keyword)
                 validated_keywords.append(keyword)
             except ValueError as e:
                 logger.debug(f"Invalid keyword {keyword}: {e}")
 
-        # keyword count should max 5, so delete the rest
-        if len(validated_keywords) > 5:
-            validated_keywords = validated_keywords[:5]
         self._set_property(self._get_key("keywords"), validated_keywords)
 
     def sync(self, metadata: ProjectMetadata) -> None:
@@ -39,12 +39,18 @@ def init_somesy_logger():
     set_log_level(SomesyLogLevel.DEBUG)
 
 
-@pytest.fixture
-def somesy_input() -> SomesyInput:
-    """Return a somesy input instance."""
+@pytest.fixture(scope="session")
+def somesy_input_template() -> SomesyInput:
+    """Parse the example somesy input only once per test session."""
     return SomesyInput.from_input_file(Path("tests/data/somesy.toml"))
 
 
+@pytest.fixture
+def somesy_input(somesy_input_template) -> SomesyInput:
+    """Return a somesy input instance (independent copy, can be modified)."""
+    return somesy_input_template.model_copy(deep=True)
+
+
 @pytest.fixture
 def file_types() -> Type[FileTypes]:
     """Return a FileTypes instance."""
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from somesy.core.core import discover_input
+from somesy.core.core import discover_input, dump_toml, parse_toml
 from somesy.core.models import ProjectMetadata, SomesyConfig
 from somesy.core.types import ContributionTypeEnum, LicenseEnum
 
@@ -50,6 +50,17 @@ def test_discover_input(create_files, file_types, monkeypatch: pytest.MonkeyPatc
         discover_input(input_file)
 
 
+def test_toml_line_endings():
+    doc, newline = parse_toml(b'[a]\r\nb = "c"\r\n')
+    assert newline == "\r\n"
+    doc["a"]["d"] = "e"  # added keys get the line separator of the file as well
+    assert dump_toml(doc, newline) == b'[a]\r\nb = "c"\r\nd = "e"\r\n'
+
+    doc, newline = parse_toml(b'b = "c"\n')
+    assert newline == "\n"
+    assert dump_toml(doc, newline) == b'b = "c"\n'
+
+
 def test_somesy_input(somesy_input):
     # test config inputs
     assert isinstance(somesy_input.config, SomesyConfig)
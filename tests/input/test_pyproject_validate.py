@@ -2,6 +2,7 @@ import pytest
 from tomlkit import dump
 
 from somesy.pyproject import Pyproject
+from somesy.pyproject.models import URLs, _all_files_exist
 
 
 def test_poetry_validate_accept(load_files, file_types):
@@ -34,3 +35,44 @@ def test_poetry_validate(tmp_path):
         dump(reject_setuptools_object, f)
     with pytest.raises(ValueError):
         Pyproject(invalid_poetry_path)
+
+
+def test_url_validate():
+    """Test that canonical URLs are accepted as-is and others are still checked."""
+    urls = URLs(homepage="https://example.com", repository="http://example.com/a")
+    assert urls.homepage == "https://example.com"
+    assert urls.repository == "http://example.com/a"
+
+    with pytest.raises(ValueError):
+        URLs(homepage="ftp://example.com")
+    with pytest.raises(ValueError):
+        URLs(homepage="https://")
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://?",
+        "https://:::",
+        "https://[::1",
+        "https://x.com:65536",
+        "https://999.1.1.1",
+        "https://" + "a" * 2076,
+    ],
+)
+def test_url_validate_reject(url):
+    """Test that malformed URLs are not accepted by the fast path."""
+    with pytest.raises(ValueError):
+        URLs(homepage=url)
+
+
+def test_all_files_exist(tmp_path):
+    """Test checking readme files grouped by directory."""
+    (tmp_path / "sub").mkdir()
+    for name in ["README.md", "CHANGELOG.md", "sub/README.md"]:
+        (tmp_path / name).touch()
+
+    assert _all_files_exist([tmp_path / "README.md", tmp_path / "sub" / "README.md"])
+    assert not _all_files_exist([tmp_path / "README.md", tmp_path / "MISSING.md"])
+    assert not _all_files_exist([tmp_path / "sub"])
+    assert not _all_files_exist([tmp_path / "missing" / "README.md"])
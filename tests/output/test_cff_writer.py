@@ -1,13 +1,28 @@
+import copy
+from pathlib import Path
+
 import pytest
+from ruamel.yaml import YAML
 
 from somesy.cff.writer import CFF
 from somesy.core.models import LicenseEnum, Person, ProjectMetadata
 
+# for checking written files plain dicts are enough (uses C loader, if available)
+_safe_yaml = YAML(typ="safe")
+
+
+@pytest.fixture(scope="module")
+def cff_template() -> CFF:
+    """Parse the example CITATION.cff only once per module."""
+    return CFF(Path("tests/data/CITATION.cff"))
+
 
 @pytest.fixture
-def cff(load_files, file_types):
-    files = load_files([file_types.CITATION])
-    return files[file_types.CITATION]
+def cff(cff_template: CFF) -> CFF:
+    """Return an independent copy of the example CFF file handler."""
+    cff = copy.copy(cff_template)
+    cff._data = copy.deepcopy(cff_template._data)
+    return cff
 
 
 def test_content_match(cff: CFF):
@@ -64,7 +79,7 @@ def test_person_merge(tmp_path, person: Person):
 
     # check that serialization preserves key order
     # (load raw dict from yaml and see order of keys)
-    dct = cff._yaml.load(open(cff_path))
+    dct = _safe_yaml.load(cff_path.read_bytes())
     assert list(dct["authors"][0].keys()) == to_cff_keys(person._key_order)
 
     # jane becomes john -> modified person
@@ -91,14 +106,12 @@ def test_person_merge(tmp_path, person: Person):
     cff.save()
 
     # existing author order preserved
-    assert cff.authors[0] == person1b.model_dump(
-        by_alias=True, exclude={"author", "publication_author"}
-    )
-    assert cff.authors[1] == person2.model_dump(
-        by_alias=True, exclude={"author", "publication_author"}
-    )
+    authors = cff.authors  # converted on each access, so only get them once
+    exclude = {"author", "publication_author"}
+    assert authors[0] == person1b.model_dump(by_alias=True, exclude=exclude)
+    assert authors[1] == person2.model_dump(by_alias=True, exclude=exclude)
     # existing author field order preserved
-    dct = cff._yaml.load(open(cff_path, "r"))
+    dct = _safe_yaml.load(cff_path.read_bytes())
     assert list(dct["authors"][0].keys()) == to_cff_keys(person1b._key_order)
     assert list(dct["authors"][1].keys()) == to_cff_keys(person2._key_order)
 
@@ -124,13 +137,10 @@ def test_person_merge(tmp_path, person: Person):
     cff.sync(pm)
     cff.save()
 
-    assert len(cff.authors) == 2
+    authors = cff.authors
+    assert len(authors) == 2
     assert len(cff.maintainers) == 1
-    assert cff.authors[0] == person1c.model_dump(
-        by_alias=True, exclude={"author", "publication_author"}
-    )
-    assert cff.authors[1] == person3.model_dump(
-        by_alias=True, exclude={"author", "publication_author"}
-    )
-    dct = cff._yaml.load(open(cff_path, "r"))
+    assert authors[0] == person1c.model_dump(by_alias=True, exclude=exclude)
+    assert authors[1] == person3.model_dump(by_alias=True, exclude=exclude)
+    dct = _safe_yaml.load(cff_path.read_bytes())
     assert list(dct["authors"][0].keys()) == to_cff_keys(person1c._key_order)
@@ -12,13 +12,13 @@ def test_update_codemeta(somesy_input, tmp_path):
     cm.save()
 
     assert codemeta_file.is_file()
-    dat = open(codemeta_file, "rb").read()
+    dat = codemeta_file.read_bytes()
 
     # second time, no changes but codemeta.json exists -> codemeta.json is the same
     cm.sync(somesy_input.project)
     cm.save()
     assert codemeta_file.is_file()
-    dat2 = open(codemeta_file, "rb").read()
+    dat2 = codemeta_file.read_bytes()
     assert dat == dat2
 
     # third time, change the project name -> codemeta.json is different
@@ -26,7 +26,7 @@ def test_update_codemeta(somesy_input, tmp_path):
     cm.sync(somesy_input.project)
     cm.save()
     assert codemeta_file.is_file()
-    dat3 = open(codemeta_file, "rb").read()
+    dat3 = codemeta_file.read_bytes()
     assert dat != dat3
 
     # fourth time, change the project name back and change version in codemeta.json
@@ -39,6 +39,6 @@ def test_update_codemeta(somesy_input, tmp_path):
     cm.sync(somesy_input.project)
     cm.save()
     assert codemeta_file.is_file()
-    dat4 = open(codemeta_file, "rb").read()
+    dat4 = codemeta_file.read_bytes()
     assert dat == dat4
     assert dat3 != dat4
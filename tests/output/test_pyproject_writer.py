@@ -1,9 +1,12 @@
+import os
 from pathlib import Path
 
 import pytest
+import tomlkit
 
 from somesy.core.models import LicenseEnum, Person, ProjectMetadata
-from somesy.pyproject.writer import Poetry, SetupTools
+from somesy.core.writer import IgnoreKey
+from somesy.pyproject.writer import Poetry, Pyproject, SetupTools
 
 
 @pytest.fixture
@@ -92,6 +95,11 @@ def test_from_to_person(person):
     assert p.full_name == person.full_name
     assert p.email == person.email
 
+    # email is optional for setuptools
+    no_email = person.model_copy(update={"email": None})
+    assert SetupTools._from_person(no_email) == {"name": person.full_name}
+    assert SetupTools._to_person({"name": person.full_name}).email is None
+
 
 @pytest.mark.parametrize(
     "writer_class, writer_file_fixture",
@@ -214,3 +222,151 @@ def test_without_email(tmp_path, person):
 
     assert len(p.authors) == 1
     assert len(p.maintainers) == 1
+
+
+def test_validate_only_when_changed(pyproject_poetry_file, mocker):
+    pj = Poetry(pyproject_poetry_file)
+    validate = mocker.spy(pj._model_cls, "model_validate")
+
+    pj._validate()  # unchanged since load -> skipped
+    validate.assert_not_called()
+
+    pj.description = "Changed description"
+    pj._validate()
+    validate.assert_called_once()
+
+
+def test_save_after_validate(pyproject_poetry_file):
+    pj = Poetry(pyproject_poetry_file)
+    pj.description = "Changed description"
+    pj._validate()  # validation must not hide the pending change
+    pj.save()
+    assert "Changed description" in pyproject_poetry_file.read_text()
+    assert Poetry(pyproject_poetry_file).description == "Changed description"
+
+
+def test_property_string_key(pyproject_poetry_file):
+    pj = Poetry(pyproject_poetry_file)
+    assert pj._get_property("name") == "test-package"
+    pj._set_property("name", "renamed-package")
+    assert pj._get_property(["name"]) == "renamed-package"
+
+
+def test_ignored_key(pyproject_poetry_file):
+    pj = Poetry(pyproject_poetry_file)
+    pj.direct_mappings["maintainers"] = IgnoreKey()
+    assert pj.maintainers == []
+    pj.maintainers = [Person(given_names="Jane", family_names="Doe")]
+    assert isinstance(pj._get_key("maintainers"), IgnoreKey)
+    assert pj._get_property(["maintainers"]) is None  # setting it was a no-op
+
+
+def test_save_unchanged(pyproject_poetry_file, mocker):
+    pj = Poetry(pyproject_poetry_file)
+    dumps = mocker.spy(tomlkit, "dumps")
+    pj.save()  # nothing set since loading -> not even serialized
+    dumps.assert_not_called()
+
+    pj.description = "Changed description"
+    pj.save()
+    write = mocker.spy(os, "replace")
+
+    pj.save()  # nothing changed -> file is not rewritten
+    write.assert_not_called()
+
+    pj.description = "Another description"
+    pj.save()
+    write.assert_called_once()
+    assert "Another description" in pyproject_poetry_file.read_text()
+    # written atomically via a temporary file, which does not remain
+    assert list(pyproject_poetry_file.parent.iterdir()) == [pyproject_poetry_file]
+
+
+def test_save_keeps_line_endings(pyproject_poetry_file, mocker):
+    crlf = pyproject_poetry_file.read_bytes().replace(b"\r\n", b"\n")
+    pyproject_poetry_file.write_bytes(crlf.replace(b"\n", b"\r\n"))
+    pj = Poetry(pyproject_poetry_file)
+    pj.description = pj.description  # marks as changed, but content is the same
+    write = mocker.spy(os, "replace")
+    pj.save()
+    write.assert_not_called()
+
+    pj.description = "Another description"
+    pj.maintainers = [  # a new key
+        Person(given_names="Jane", family_names="Doe", email="jane@example.com")
+    ]
+    pj.save()
+    content = pyproject_poetry_file.read_bytes()
+    assert b"maintainers" in content
+    assert b"\r\n" in content
+    assert b"\n" not in content.replace(b"\r\n", b"")  # no mixed line endings
+
+
+def test_save_through_symlink(pyproject_poetry_file, tmp_path):
+    link = tmp_path / "link" / "pyproject.toml"
+    link.parent.mkdir()
+    link.symlink_to(pyproject_poetry_file)
+    pj = Poetry(link)
+    pj.description = "Another description"
+    pj.save()
+
+    assert link.is_symlink()
+    assert "Another description" in pyproject_poetry_file.read_text()
+    assert list(link.parent.iterdir()) == [link]
+
+
+def test_save_new_file_mode(pyproject_poetry_file, tmp_path):
+    umask = os.umask(0o022)
+    try:
+        target = tmp_path / "new" / "pyproject.toml"
+        target.parent.mkdir()
+        Poetry(pyproject_poetry_file).save(target)
+    finally:
+        os.umask(umask)
+    assert target.stat().st_mode & 0o777 == 0o644
+
+
+def test_save_keeps_hard_links(pyproject_poetry_file, tmp_path):
+    link = tmp_path / "link.toml"
+    os.link(pyproject_poetry_file, link)
+    pj = Poetry(pyproject_poetry_file)
+    pj.description = "Another description"
+    pj.save()
+    assert "Another description" in link.read_text()
+
+
+def test_save_failure_cleans_up(pyproject_poetry_file, mocker):
+    pj = Poetry(pyproject_poetry_file)
+    pj.description = "Another description"
+    mocker.patch("os.replace", side_effect=OSError)
+    with pytest.raises(OSError):
+        pj.save()
+    assert list(pyproject_poetry_file.parent.iterdir()) == [pyproject_poetry_file]
+
+
+def test_setuptools_person_array(pyproject_setuptools_file, somesy_input):
+    st = SetupTools(pyproject_setuptools_file)
+    st.sync(somesy_input.project)
+    st.save()
+
+    content = pyproject_setuptools_file.read_text()
+    assert "[[project.authors]]" not in content
+    assert '    {name = "John Doe", email = "john.doe@example.com"},' in content
+    assert len(SetupTools(pyproject_setuptools_file).authors) == 2
+
+
+def test_pyproject_wrapped_class(pyproject_poetry_file):
+    pj = Pyproject(pyproject_poetry_file)
+    assert not isinstance(pj, Poetry)  # not a transparent proxy
+    assert isinstance(pj.__wrapped__, Poetry)
+    assert pj.name == "test-package"
+
+
+def test_pyproject_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        Pyproject(tmp_path / "pyproject.toml")
+    with pytest.raises(FileNotFoundError):
+        Pyproject(tmp_path)  # a directory is not a pyproject file
+    (tmp_path / "file").touch()
+    with pytest.raises(FileNotFoundError):
+        Pyproject(tmp_path / "file" / "pyproject.toml")  # parent is not a directory
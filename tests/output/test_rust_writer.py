@@ -39,6 +39,39 @@ def test_save(tmp_path, rust):
     custom_path.unlink()
 
 
+def test_save_keeps_line_endings(rust_file):
+    rust_file.write_bytes(rust_file.read_bytes().replace(b"\n", b"\r\n"))
+    rust = Rust(rust_file)
+    rust.homepage = None
+    rust.homepage = "https://example.com/new"  # re-added as a new key
+    rust.save()
+
+    content = rust_file.read_bytes()
+    assert b"https://example.com/new" in content
+    assert b"\r\n" in content
+    assert b"\n" not in content.replace(b"\r\n", b"")  # no mixed line endings
+
+
+def test_save_through_symlink(rust_file, tmp_path):
+    link = tmp_path / "link" / "Cargo.toml"
+    link.parent.mkdir()
+    link.symlink_to(rust_file)
+    rust = Rust(link)
+    rust.description = "Another description"
+    rust.save()
+
+    assert link.is_symlink()
+    assert "Another description" in rust_file.read_text()
+    assert list(link.parent.iterdir()) == [link]
+
+
+def test_property_string_key(rust_file):
+    rust = Rust(rust_file)
+    assert rust._get_property("name") == "test-package"
+    rust._set_property("name", "renamed-package")
+    assert rust._get_property(["name"]) == "renamed-package"
+
+
 def test_from_to_person(person):
     assert Rust._from_person(person) == f"{person.full_name} <{person.email}>"
 
@@ -37,6 +37,19 @@ def test_same_person():
     assert Person(**p1).same_person(Person(**p6))
 
 
+def test_from_name_email_string():
+    p = Person.from_name_email_string("John Jim Doe <j.doe@example.com>")
+    assert p.given_names == "John Jim"
+    assert p.family_names == "Doe"
+    assert p.email == "j.doe@example.com"
+
+    # e-mail is optional, incomplete e-mail part is treated as part of the name
+    p = Person.from_name_email_string("  John   Doe ")
+    assert p.full_name == "John Doe"
+    assert p.email is None
+    assert Person.from_name_email_string("John Doe <>").family_names == "<>"
+
+
 def test_detect_duplicate_person(somesy_input):
     metadata = somesy_input.project
 